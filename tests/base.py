@@ -17,14 +17,22 @@ Helper functions and cases for making assertions on visualizations.
 import os
 import sys
 import inspect
-
+import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
+from functools import lru_cache
 from matplotlib import ticker
-from matplotlib.testing.compare import compare_images
+from matplotlib.image import imread
+from matplotlib.testing.compare import compare_images, calculate_rms
 from yellowbrick.exceptions import ImageComparisonFailure
 
+# newer versions of matplotlib load images for comparison with this helper
+try:
+    from matplotlib.testing.compare import _load_image
+except ImportError:
+    _load_image = None
+
 
 ##########################################################################
 ## Environment
@@ -51,6 +59,34 @@ BASELINE_IMAGES = os.path.join(TESTS, "baseline_images")
 IS_WINDOWS_OR_CONDA = is_windows_or_conda()
 
 
+##########################################################################
+## Image Loading
+##########################################################################
+
+@lru_cache(maxsize=128)
+def _load_baseline(path, mtime):
+    """
+    Loads and decodes a baseline PNG image as an array of signed integers in
+    [0, 255], the same representation used by matplotlib's compare_images.
+    The result is cached so that repeated comparisons against the same
+    baseline in a session do not reread it from disk; the modification time
+    is part of the key so that a regenerated baseline is reloaded.
+    """
+    return _read_png(path)
+
+
+def _read_png(path):
+    """
+    Reads a PNG image from disk with the same channels that compare_images
+    uses: newer versions of matplotlib keep the alpha channel unless the image
+    is fully opaque, while older versions always drop it.
+    """
+    if _load_image is not None:
+        return _load_image(path).astype(np.int16)
+    image = imread(path)[:, :, :3]
+    return np.round(image * 255).astype(np.int16)
+
+
 ##########################################################################
 ## Visual Test Case
 ##########################################################################
@@ -276,10 +312,9 @@ class ImageComparison(object):
         # Directory the images for this module are stored in.
         imgdir = os.path.join(root, self.test_module_path)
 
-        # Create directory if it doesn't exist
-        # TODO: remove dependency on mpl.cbook
-        if not os.path.exists(imgdir):
-            mpl.cbook.mkdirs(imgdir)
+        # Create directory if it doesn't exist; exist_ok ensures that parallel
+        # test workers (e.g. pytest -n auto) do not race to create it.
+        os.makedirs(imgdir, exist_ok=True)
 
         # Create the image path from the test name
         return os.path.join(imgdir, self.test_func_name + self.ext)
@@ -341,6 +376,15 @@ class ImageComparison(object):
             raise ImageComparisonFailure(
                 'baseline image does not exist:\n{}'.format(os.path.relpath(expected))
             )
+        # Fast path: compare against the cached baseline pixels and only fall
+        # back to compare_images (which writes a diff image) when not close.
+        if self.ext == ".png":
+            baseline = _load_baseline(expected, os.path.getmtime(expected))
+            image = _read_png(actual)
+            if image.shape == baseline.shape:
+                if calculate_rms(baseline, image) <= self.tol:
+                    return
+
         # Perform the comparison
         err = compare_images(expected, actual, self.tol, in_decorator=True)
 
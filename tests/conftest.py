@@ -18,7 +18,9 @@ Global definitions for Yellowbrick PyTest
 ##########################################################################
 
 import os
+import pytest
 import matplotlib as mpl
+import matplotlib.pyplot as plt
 
 from pytest_flakes import FlakesItem
 
@@ -46,6 +48,17 @@ def pytest_configure(config):
     mpl.rcParams['font.family'] = 'DejaVu Sans'
 
 
+@pytest.fixture(autouse=True)
+def close_figures():
+    """
+    Close all matplotlib figures after every test so that no figure state is
+    shared between tests, which also allows the suite to be run in parallel
+    with pytest-xdist (e.g. ``pytest -n auto``).
+    """
+    yield
+    plt.close("all")
+
+
 ##########################################################################
 ## PyTest Hooks
 ##########################################################################
@@ -20,6 +20,7 @@ Tests for the classification report visualizer
 
 import sys
 import pytest
+import numpy as np
 import yellowbrick as yb
 import matplotlib.pyplot as plt
 
@@ -209,6 +210,22 @@ class TestClassificationReport(VisualTestCase):
 
         self.assert_images_similar(ax=ax, tol=25.0)
 
+    def test_quick_method_split(self):
+        """
+        Test the quick method passes the splitting options to train_test_split
+        """
+        X, y = make_classification(
+            n_samples=400, n_features=20, n_classes=2, random_state=27
+        )
+
+        _, ax = plt.subplots()
+        model = DecisionTreeClassifier(random_state=19)
+        viz = classification_report(model, X, y, ax=ax, test_size=100, shuffle=False)
+
+        # Without shuffling the test split is the last block of the data
+        assert viz.support_score_.sum() == 100
+        assert list(viz.support_score_) == list(np.bincount(y[-100:]))
+
     def test_isclassifier(self):
         """
         Assert that only classifiers can be used with the visualizer.
@@ -282,6 +299,136 @@ class TestClassificationReport(VisualTestCase):
 
         assert 0 <= s <= 1
 
+    def test_rescore_reuses_artists(self):
+        """
+        Test that calling score() again updates the heatmap, labels and colorbar
+        """
+        fig, ax = plt.subplots()
+
+        viz = ClassificationReport(LinearSVC(random_state=42), ax=ax)
+        viz.fit(self.binary.X.train, self.binary.y.train)
+        viz.score(self.binary.X.train, self.binary.y.train)
+        mesh, colorbar = viz._mesh, viz._colorbar
+
+        viz.score(self.binary.X.test, self.binary.y.test)
+        assert viz._mesh is mesh
+        assert viz._colorbar is colorbar
+        assert len(fig.axes) == 2
+        assert len(ax.collections) == 1
+        assert len(ax.texts) == 6
+
+        # The updated report should match a report drawn from scratch
+        _, fresh_ax = plt.subplots()
+        fresh = ClassificationReport(viz.estimator, ax=fresh_ax, is_fitted=True)
+        fresh.score(self.binary.X.test, self.binary.y.test)
+
+        assert np.array_equal(mesh.get_array(), fresh._mesh.get_array())
+        assert sorted(
+            (text.get_position(), text.get_text(), text.get_color())
+            for text in ax.texts
+        ) == sorted(
+            (text.get_position(), text.get_text(), text.get_color())
+            for text in fresh_ax.texts
+        )
+
+    def test_finalize_before_score(self):
+        """
+        Test that the report can be finalized after fit without being scored
+        """
+        _, ax = plt.subplots()
+
+        viz = ClassificationReport(LinearSVC(random_state=42), ax=ax)
+        viz.fit(self.binary.X.train, self.binary.y.train)
+        viz.finalize()
+
+        assert [tick.get_text() for tick in ax.get_yticklabels()] == ["0", "1"]
+
+    def test_no_colorbar(self):
+        """
+        Test that the colorbar can be omitted from the report
+        """
+        fig, ax = plt.subplots()
+
+        viz = ClassificationReport(LinearSVC(random_state=42), ax=ax, colorbar=False)
+        viz.fit(self.binary.X.train, self.binary.y.train)
+        viz.score(self.binary.X.test, self.binary.y.test)
+
+        assert len(fig.axes) == 1
+        assert viz.get_params()["colorbar"] is False
+
+    def test_quick_method_no_colorbar(self):
+        """
+        Test that the quick method can omit the colorbar from the report
+        """
+        X, y = make_classification(
+            n_samples=400, n_features=20, n_classes=2, random_state=27
+        )
+
+        fig, ax = plt.subplots()
+        model = DecisionTreeClassifier(random_state=19)
+        viz = classification_report(
+            model, X, y, ax=ax, random_state=42, colorbar=False
+        )
+
+        assert viz.colorbar is False
+        assert len(fig.axes) == 1
+
+    def test_is_fitted_positional(self):
+        """
+        Test that is_fitted can still be passed by position
+        """
+        viz = ClassificationReport(LinearSVC(), None, None, "YlOrRd", None, False)
+        assert viz.colorbar is True
+
+    def test_score_predicts_once(self):
+        """
+        Test that ClassificationReport score() does not predict on X twice
+        """
+        viz = ClassificationReport(LinearSVC(random_state=42))
+        viz.fit(self.binary.X.train, self.binary.y.train)
+
+        model = viz.estimator
+        with patch.object(model, "predict", wraps=model.predict) as mockpredict:
+            s = viz.score(self.binary.X.test, self.binary.y.test)
+            mockpredict.assert_called_once()
+
+        assert s == approx(model.score(self.binary.X.test, self.binary.y.test))
+
+    def test_score_column_vector(self):
+        """
+        Test that ClassificationReport score() accepts a column vector target
+        """
+        viz = ClassificationReport(LinearSVC(random_state=42))
+        viz.fit(self.binary.X.train, self.binary.y.train)
+
+        y_test = np.asarray(self.binary.y.test)
+        expected = viz.estimator.score(self.binary.X.test, y_test)
+        assert viz.score(self.binary.X.test, y_test.reshape(-1, 1)) == approx(
+            expected
+        )
+
+    @pytest.mark.skipif(pd is None, reason="test requires pandas")
+    def test_score_dataframe_target(self):
+        """
+        Test that ClassificationReport score() accepts a single column DataFrame
+        """
+        viz = ClassificationReport(LinearSVC(random_state=42))
+        viz.fit(self.binary.X.train, self.binary.y.train)
+
+        y_test = pd.DataFrame({"target": self.binary.y.test})
+        expected = viz.estimator.score(self.binary.X.test, self.binary.y.test)
+        assert viz.score(self.binary.X.test, y_test[["target"]]) == approx(expected)
+
+    def test_score_inconsistent_lengths(self):
+        """
+        Test that ClassificationReport score() rejects targets of the wrong length
+        """
+        viz = ClassificationReport(LinearSVC(random_state=42))
+        viz.fit(self.binary.X.train, self.binary.y.train)
+
+        with pytest.raises(ValueError, match="inconsistent numbers of samples"):
+            viz.score(self.binary.X.test, self.binary.y.test[:1])
+
     @pytest.mark.xfail(
         reason="""third test fails with AssertionError: Expected fit
         to be called once. Called 0 times. This should be fixed by #939"""
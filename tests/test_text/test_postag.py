@@ -19,6 +19,7 @@ Tests for the part-of-speech tagging visualization
 ##########################################################################
 
 import pytest
+import numpy as np
 
 from yellowbrick.exceptions import YellowbrickValueError
 from yellowbrick.text.postag import *
@@ -190,6 +191,251 @@ class TestPosTag(VisualTestCase):
         with pytest.raises(YellowbrickValueError):
             PosTagVisualizer(tagset="brill")
 
+        viz = PosTagVisualizer().set_params(tagset="brill")
+        with pytest.raises(YellowbrickValueError):
+            viz.fit([[[("Ships", "NNS")]]])
+
+    def test_penn_treebank_tag_map(self):
+        """
+        Assert Penn Treebank tags are counted as the correct part-of-speech
+        """
+        tagged_docs = [[
+            [("All", "PDT"), ("the", "DT"), ("ships", "NNS"), ("sail", "VBP"),
+             ("quickly", "RB"), ("out", "RP"), ("to", "TO"), ("17", "CD"),
+             ("seas", "NNS"), (".", ".")],
+            [("Who", "WP"), ("would", "MD"), ("n't", "RB"), ("?", "."),
+             ("*", "-NONE-")],
+        ]]
+
+        viz = PosTagVisualizer()
+        viz.fit(tagged_docs)
+        counts = viz.pos_tag_counts_["documents"]
+
+        assert counts["determiner"] == 2
+        assert counts["noun"] == 2
+        assert counts["verb"] == 1
+        assert counts["adverb"] == 3
+        assert counts["infinitive"] == 1
+        assert counts["digit"] == 1
+        assert counts["wh- word"] == 1
+        assert counts["modal"] == 1
+        assert counts["punctuation"] == 2
+        assert counts["other"] == 1
+        assert sum(counts.values()) == 15
+
+    def test_stack_tag_counts(self):
+        """
+        Assert part-of-speech counts are computed per label when stacked
+        """
+        tagged_docs = [
+            [[("Ships", "NNS"), ("sail", "VBP"), (".", ".")]],
+            [[("Dogs", "NNS"), ("bark", "VBP")]],
+            [[("Run", "VB"), ("!", ".")]],
+        ]
+
+        viz = PosTagVisualizer(stack=True)
+        viz.fit(tagged_docs, y=["b", "a", "b"])
+
+        assert list(viz.pos_tag_counts_.keys()) == ["a", "b"]
+        assert viz.pos_tag_counts_["a"]["noun"] == 1
+        assert viz.pos_tag_counts_["a"]["verb"] == 1
+        assert viz.pos_tag_counts_["a"]["punctuation"] == 0
+        assert viz.pos_tag_counts_["b"]["noun"] == 1
+        assert viz.pos_tag_counts_["b"]["verb"] == 2
+        assert viz.pos_tag_counts_["b"]["punctuation"] == 2
+        assert list(viz.pos_tag_counts_["b"].keys()) == PENN_TAGS
+
+    def test_tag_counts_refit(self):
+        """
+        Assert the tag counts mapping is reused until the visualizer is refit
+        """
+        viz = PosTagVisualizer()
+        viz.fit([[[("Ships", "NNS"), ("sail", "VBP")]]])
+        counts = viz.pos_tag_counts_
+        assert viz.pos_tag_counts_ is counts
+        assert counts["documents"]["noun"] == 1
+
+        viz.fit([[[("Dogs", "NNS"), ("and", "CC"), ("cats", "NNS")]]])
+        assert viz.pos_tag_counts_ is not counts
+        assert viz.pos_tag_counts_["documents"]["noun"] == 2
+
+    @pytest.mark.parametrize("tagset, tags", [
+        ("penn_treebank", ["NN", "VBZ", "DT", "PDT", ".", "NNP", "XX", "RB"]),
+        ("universal", ["NOUN", "VERB", "DET", "SPACE", "PUNCT", "X", "ADV"]),
+    ])
+    @pytest.mark.parametrize("stack", [False, True])
+    def test_flat_tags(self, tagset, tags, stack):
+        """
+        Assert a flat array of tags is counted the same as a nested corpus
+        """
+        tagged_docs = [
+            [[("w", tags[(doc + idx) % len(tags)]) for idx in range(doc * 3)]]
+            for doc in range(5)
+        ]
+        y = ["a", "b", "a", "c", "b"]
+
+        nested = PosTagVisualizer(tagset=tagset, stack=stack)
+        nested.fit(tagged_docs, y=y)
+
+        flat_tags = [tag for doc in tagged_docs for _, tag in doc[0]]
+        flat_y = [y[idx] for idx, doc in enumerate(tagged_docs) for _ in doc[0]]
+
+        flat = PosTagVisualizer(tagset=tagset, stack=stack)
+        flat.fit(np.array(flat_tags), y=np.array(flat_y), tags_are_flat=True)
+
+        assert flat.pos_tag_counts_ == nested.pos_tag_counts_
+
+    def test_flat_tags_labels_mismatch(self):
+        """
+        Ensure an exception is raised if flat tags and labels differ in length
+        """
+        viz = PosTagVisualizer(stack=True)
+        with pytest.raises(YellowbrickValueError, match="label for every tag"):
+            viz.fit(["NN", "VB", "DT"], y=["a", "b"], tags_are_flat=True)
+
+    @pytest.mark.parametrize("tags", [
+        ["NN", "VB", None],
+        np.array(["NN", np.nan, "DT"], dtype=object),
+        np.array([np.nan, np.nan]),
+    ])
+    def test_flat_tags_missing(self, tags):
+        """
+        Ensure an exception is raised if flat tags contain missing values
+        """
+        viz = PosTagVisualizer()
+        with pytest.raises(YellowbrickValueError, match="missing tags"):
+            viz.fit(tags, tags_are_flat=True)
+
+    def test_frequency_redraw(self):
+        """
+        Assert tags remain sorted by frequency when draw is called again
+        """
+        tagged_docs = [[
+            [("Ships", "NNS"), ("sail", "VBP"), ("and", "CC"), ("dogs", "NNS"),
+             ("bark", "VBP"), ("loudly", "RB"), ("at", "IN"), ("cats", "NNS")]
+        ]]
+
+        _, ax = plt.subplots()
+        viz = PosTagVisualizer(ax=ax, frequency=True)
+        viz.fit(tagged_docs)
+        viz.finalize()
+        ticks = [tick.get_text() for tick in ax.xaxis.get_ticklabels()]
+        assert ticks[:2] == ["noun", "verb"]
+
+        viz.draw()
+        viz.finalize()
+        assert [tick.get_text() for tick in ax.xaxis.get_ticklabels()] == ticks
+
+        # Turning frequency off restores the tagset order of labels and bars
+        ax.clear()
+        viz.set_params(frequency=False)
+        viz.draw()
+        viz.finalize()
+        ticks = [tick.get_text() for tick in ax.xaxis.get_ticklabels()]
+        heights = [patch.get_height() for patch in ax.patches]
+        assert ticks == PENN_TAGS
+        assert heights[:4] == [3, 2, 0, 1]
+
+    @pytest.mark.parametrize("frequency, expected", [
+        (True, ["adverb", "noun", "verb"]),
+        (False, ["noun", "verb", "adverb"]),
+    ])
+    def test_top_k(self, frequency, expected):
+        """
+        Assert only the top_k most frequent tags are plotted
+        """
+        tagged_docs = [[
+            [("Ships", "NNS"), ("sail", "VBP"), ("very", "RB"), ("fast", "RB"),
+             ("and", "CC"), ("dogs", "NNS"), ("bark", "VBP"), ("at", "IN"),
+             ("cats", "NNS"), ("quite", "RB"), ("loudly", "RB")]
+        ]]
+
+        _, ax = plt.subplots()
+        viz = PosTagVisualizer(ax=ax, frequency=frequency, top_k=3)
+        viz.fit(tagged_docs)
+        viz.finalize()
+
+        ticks = [tick.get_text() for tick in ax.xaxis.get_ticklabels()]
+        assert ticks == expected
+        assert len(ax.patches) == 3
+
+    def test_top_k_reset(self):
+        """
+        Assert all tags are plotted again when top_k is reset to None
+        """
+        tagged_docs = [[[("Ships", "NNS"), ("sail", "VBP"), ("fast", "RB")]]]
+
+        _, ax = plt.subplots()
+        viz = PosTagVisualizer(ax=ax, top_k=2)
+        viz.fit(tagged_docs)
+        assert len(ax.patches) == 2
+
+        ax.clear()
+        viz.set_params(top_k=None)
+        viz.draw()
+        viz.finalize()
+
+        assert [tick.get_text() for tick in ax.xaxis.get_ticklabels()] == PENN_TAGS
+        assert len(ax.patches) == len(PENN_TAGS)
+
+    def test_top_k_ties(self):
+        """
+        Assert tags tied in frequency are ordered by the tagset with top_k
+        """
+        tagged_docs = [[
+            [("Ships", "NNS"), ("sail", "VBP"), ("dogs", "NNS"), ("bark", "VBP"),
+             ("loudly", "RB")]
+        ]]
+
+        _, ax = plt.subplots()
+        viz = PosTagVisualizer(ax=ax, frequency=True, top_k=len(PENN_TAGS))
+        viz.fit(tagged_docs)
+        viz.finalize()
+
+        rest = [tag for tag in PENN_TAGS if tag not in ("noun", "verb", "adverb")]
+        ticks = [tick.get_text() for tick in ax.xaxis.get_ticklabels()]
+        assert ticks == ["noun", "verb", "adverb"] + rest
+
+    def test_colors_redraw(self):
+        """
+        Assert updated colors are used when the visualizer is redrawn
+        """
+        tagged_docs = [[[("Ships", "NNS"), ("sail", "VBP")]]]
+
+        _, ax = plt.subplots()
+        viz = PosTagVisualizer(ax=ax, colors=["red"], top_k=2)
+        viz.fit(tagged_docs)
+        assert [patch.get_facecolor() for patch in ax.patches] == [
+            (1.0, 0.0, 0.0, 1.0)
+        ] * 2
+
+        viz.set_params(colors=["blue"])
+        ax.clear()
+        viz.draw()
+        assert [patch.get_facecolor() for patch in ax.patches] == [
+            (0.0, 0.0, 1.0, 1.0)
+        ] * 2
+
+    @pytest.mark.parametrize("top_k", [0, -1, 2.5, "3", True])
+    def test_invalid_top_k(self, top_k):
+        """
+        Ensure an exception is raised if top_k is not a positive integer
+        """
+        with pytest.raises(YellowbrickValueError, match="top_k"):
+            PosTagVisualizer(top_k=top_k)
+
+        viz = PosTagVisualizer().set_params(top_k=top_k)
+        with pytest.raises(YellowbrickValueError, match="top_k"):
+            viz.fit([[[("Ships", "NNS"), ("sail", "VBP")]]])
+
+    def test_numpy_integer_top_k(self):
+        """
+        Assert top_k accepts NumPy integers
+        """
+        viz = PosTagVisualizer(top_k=np.int64(2))
+        viz.fit([[[("Ships", "NNS"), ("sail", "VBP")]]])
+        assert len(viz.ax.patches) == 2
+
     def test_frequency_mode(self):
         """
         Assert no errors occur when the visualizer is run on frequency mode
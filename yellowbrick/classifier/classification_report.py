@@ -24,10 +24,12 @@ Visual classification report for classifier scoring.
 import numpy as np
 import matplotlib.pyplot as plt
 
+from functools import lru_cache
+
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import precision_recall_fscore_support
+from sklearn.utils import check_consistent_length, column_or_1d
 
-from yellowbrick.style import find_text_color
+from yellowbrick.utils import div_safe
 from yellowbrick.style.palettes import color_sequence
 from yellowbrick.exceptions import YellowbrickValueError
 from yellowbrick.classifier.base import ClassificationScoreVisualizer
@@ -41,6 +43,48 @@ CMAP_UNDERCOLOR = "w"
 CMAP_OVERCOLOR = "#2a7d4f"
 SCORES_KEYS = ("precision", "recall", "f1", "support")
 
+# Light and dark text colors, indexed by whether the background is light
+TEXT_COLORS = ("white", "black")
+
+# Perceived brightness coefficients and threshold from find_text_color
+BRIGHTNESS_COEFS = np.array((0.241, 0.691, 0.068))
+BRIGHTNESS_THRESHOLD = 130
+
+
+def _light_background(base_colors):
+    """
+    Vectorized form of the brightness test used by ``find_text_color``. Takes
+    an array of RGBA colors with values between 0 and 1 and returns a boolean
+    mask that is True where the background is light and dark text is required.
+    """
+    rgb = np.asarray(base_colors)[..., :3] * 255
+    brightness = np.sqrt(np.dot(rgb ** 2, BRIGHTNESS_COEFS))
+    return brightness > BRIGHTNESS_THRESHOLD
+
+
+@lru_cache(maxsize=32)
+def _build_cmap(name, over, under):
+    """
+    Memoized construction of a named color sequence with its over and under
+    colors set. The returned colormap is shared between reports that use the
+    same name, so it should not be modified in place.
+    """
+    cmap = color_sequence(name)
+    cmap.set_over(color=over)
+    cmap.set_under(color=under)
+    return cmap
+
+
+@lru_cache(maxsize=32)
+def _cell_centers(n):
+    """
+    Memoized tick positions at the center of n unit cells. The returned array
+    is shared between calls and is therefore marked as read-only.
+    """
+    centers = np.arange(n) + 0.5
+    centers.setflags(write=False)
+    return centers
+
 
 class ClassificationReport(ClassificationScoreVisualizer):
     """
@@ -75,6 +119,11 @@ class ClassificationReport(ClassificationScoreVisualizer):
         modified. If "auto" (default), a helper method will check if the estimator
         is fitted before fitting it again.
 
+    colorbar : bool, default: True
+        Specify if the colorbar should be drawn alongside the heatmap. Set to
+        False to save space, e.g. when several reports are composed in a
+        ``VisualizerGrid``.
+
     kwargs : dict
         Keyword arguments passed to the super class.
 
@@ -105,6 +154,7 @@ class ClassificationReport(ClassificationScoreVisualizer):
         cmap="YlOrRd",
         support=None,
         is_fitted="auto",
+        colorbar=True,
         **kwargs
     ):
         super(ClassificationReport, self).__init__(
@@ -112,9 +162,13 @@ class ClassificationReport(ClassificationScoreVisualizer):
         )
 
         self.support = support
-        self.cmap = color_sequence(cmap)
-        self.cmap.set_over(color=CMAP_OVERCOLOR)
-        self.cmap.set_under(color=CMAP_UNDERCOLOR)
+        self.colorbar = colorbar
+        if isinstance(cmap, str):
+            self.cmap = _build_cmap(cmap, CMAP_OVERCOLOR, CMAP_UNDERCOLOR)
+        else:
+            self.cmap = color_sequence(cmap)
+            self.cmap.set_over(color=CMAP_OVERCOLOR)
+            self.cmap.set_under(color=CMAP_UNDERCOLOR)
         self._displayed_scores = [key for key in SCORES_KEYS]
 
         if support not in {None, True, False, "percent", "count"}:
@@ -146,28 +200,54 @@ class ClassificationReport(ClassificationScoreVisualizer):
         """
         y_pred = self.predict(X)
 
-        scores = precision_recall_fscore_support(y, y_pred)
+        # Validate the targets as precision_recall_fscore_support would, so that
+        # column vectors are raveled and mismatched lengths raise an error
+        y, y_pred = column_or_1d(y), column_or_1d(y_pred)
+        check_consistent_length(y, y_pred)
 
-        # Calculate the percentage for the support metric
-        # and store the percent in place of raw support counts
-        self.support_score_ = scores[-1]
-
-        scores = list(scores)
-        scores[-1] = scores[-1] / scores[-1].sum()
+        # Encode the true and predicted values against the sorted union of their
+        # labels and count every (true, predicted) pair to get the confusion matrix
+        labels, encoded = np.unique(
+            np.concatenate((np.asarray(y), np.asarray(y_pred))), return_inverse=True
+        )
+        n_labels = len(labels)
+        y_true_idx, y_pred_idx = encoded[: len(y)], encoded[len(y) :]
+        cm = np.bincount(y_true_idx * n_labels + y_pred_idx, minlength=n_labels ** 2)
+        cm = cm.reshape(n_labels, n_labels)
+
+        # Derive the per-class scores from the confusion matrix; div_safe returns
+        # 0 for classes without predictions or support, matching scikit-learn.
+        tp = cm.diagonal()
+        support = cm.sum(axis=1)
+        precision = div_safe(tp, cm.sum(axis=0))
+        recall = div_safe(tp, support)
+        f1 = div_safe(2 * precision * recall, precision + recall)
+
+        # Store the raw support counts to label the grid with
+        self.support_score_ = support
+
+        # Store the scores as a (n_scores, n_classes) matrix of precision, recall,
+        # F1, and (if required) support percentage so that draw can index it
+        scores = [precision, recall, f1]
+        if self.support:
+            scores.append(support / support.sum())
+        self._scores_matrix = np.vstack(scores)
+
+        # Convert the class labels to strings once for labeling the grid
+        self._classes_str = tuple(map(str, self.classes_))
 
         # Create a mapping composed of precision, recall, F1, and support
         # to their respective values
-        scores = map(lambda s: dict(zip(self.classes_, s)), scores)
-        self.scores_ = dict(zip(SCORES_KEYS, scores))
-
-        # Remove support scores if not required
-        if not self.support:
-            self.scores_.pop("support")
+        self.scores_ = {
+            metric: dict(zip(self.classes_, row))
+            for metric, row in zip(SCORES_KEYS, self._scores_matrix)
+        }
 
         self.draw()
 
-        # Retrieve and store the score attribute from the sklearn classifier
-        self.score_ = self.estimator.score(X, y)
+        # Compute the global accuracy from the confusion matrix rather than
+        # calling estimator.score, which would predict on X a second time.
+        self.score_ = tp.sum() / cm.sum()
 
         return self.score_
 
@@ -175,56 +255,75 @@ class ClassificationReport(ClassificationScoreVisualizer):
         """
         Renders the classification report across each axis.
         """
-        # Create display grid
-        cr_display = np.zeros((len(self.classes_), len(self._displayed_scores)))
-
-        # For each class row, append columns for precision, recall, f1, and support
-        for idx, cls in enumerate(self.classes_):
-            for jdx, metric in enumerate(self._displayed_scores):
-                cr_display[idx, jdx] = self.scores_[metric][cls]
-
-        # Set up the dimensions of the pcolormesh
-        # NOTE: pcolormesh accepts grids that are (N+1,M+1)
-        X, Y = (
-            np.arange(len(self.classes_) + 1),
-            np.arange(len(self._displayed_scores) + 1),
-        )
+        # Create display grid with a row per class and a column per metric
+        # NOTE: this is a transposed view of the scores matrix, not a copy.
+        cr_display = self._scores_matrix[: len(self._displayed_scores)].T
+
+        # Set the limits of the heatmap, one unit square per class, metric pair
         self.ax.set_ylim(bottom=0, top=cr_display.shape[0])
         self.ax.set_xlim(left=0, right=cr_display.shape[1])
 
-        # Set data labels in the grid, enumerating over class, metric pairs
-        # NOTE: X and Y are one element longer than the classification report
-        # so skip the last element to label the grid correctly.
-        for x in X[:-1]:
-            for y in Y[:-1]:
-
-                # Extract the value and the text label
-                value = cr_display[x, y]
-                svalue = "{:0.3f}".format(value)
-
-                # change the svalue for support (when y == 3) because we want
-                # to label it as the actual support value, not the percentage
-                if y == 3:
-                    if self.support != PERCENT:
-                        svalue = self.support_score_[x]
+        # Determine the grid and text colors for every cell at once: the cmap
+        # returns an RGBA array of shape (C, M, 4) that is reduced to a (C, M)
+        # mask of the cells requiring dark text, which indexes TEXT_COLORS.
+        dark_text = _light_background(self.cmap(cr_display)).astype(int)
+
+        # Format the text label of every cell at once. The support column is
+        # labeled with the actual support value rather than the percentage
+        # unless otherwise specified (object dtype so counts aren't truncated).
+        svalues = np.char.mod("%0.3f", cr_display).astype(object)
+        if "support" in self._displayed_scores and self.support != PERCENT:
+            svalues[:, SCORES_KEYS.index("support")] = np.char.mod(
+                "%d", self.support_score_
+            )
 
-                # Determine the grid and text colors
-                base_color = self.cmap(value)
-                text_color = find_text_color(base_color)
+        # If the report has already been drawn on these axes with the same grid
+        # shape (e.g. score is called again), update the existing heatmap and
+        # labels in place rather than drawing new artists over the top of them.
+        if (
+            hasattr(self, "_mesh")
+            and self._mesh is not None
+            and self._mesh.axes is self.ax
+            and self._text_artists.shape == cr_display.shape
+        ):
+            self._mesh.set_array(cr_display.ravel())
+            for (x, y), text in np.ndenumerate(self._text_artists):
+                text.set_text(svalues[x, y])
+                text.set_color(TEXT_COLORS[dark_text[x, y]])
+
+        else:
+            # Set data labels in the grid, grouping the class, metric pairs by
+            # their text color so the text properties are resolved once per
+            # group (light and dark text).
+            self._text_artists = np.empty(cr_display.shape, dtype=object)
+            for idx, text_color in enumerate(TEXT_COLORS):
+                text_kws = {"va": "center", "ha": "center", "color": text_color}
 
                 # Add the label to the middle of the grid
-                cx, cy = x + 0.5, y + 0.5
-                self.ax.text(cy, cx, svalue, va="center", ha="center", color=text_color)
-
-        # Draw the heatmap with colors bounded by the min and max of the grid
-        # NOTE: I do not understand why this is Y, X instead of X, Y it works
-        # in this order but raises an exception with the other order.
-        g = self.ax.pcolormesh(
-            Y, X, cr_display, vmin=0, vmax=1, cmap=self.cmap, edgecolor="w"
-        )
+                for x, y in zip(*np.nonzero(dark_text == idx)):
+                    self._text_artists[x, y] = self.ax.text(
+                        y + 0.5, x + 0.5, svalues[x, y], **text_kws
+                    )
+
+            # Draw the heatmap with colors bounded by the min and max of the grid
+            # NOTE: without explicit coordinates pcolormesh places cell (i, j) on
+            # the unit square at [j, j+1] x [i, i+1], so no grids are allocated.
+            self._mesh = self.ax.pcolormesh(
+                cr_display, vmin=0, vmax=1, cmap=self.cmap, edgecolor="w"
+            )
 
-        # Add the color bar
-        plt.colorbar(g, ax=self.ax)  # TODO: Could use self.fig now
+        # Add the color bar if required, reusing the existing one if the report
+        # is redrawn (e.g. score is called again) rather than adding another
+        if self.colorbar:
+            if (
+                not hasattr(self, "_colorbar")
+                or self._colorbar is None
+                or self._colorbar.mappable.axes is not self.ax
+            ):
+                # TODO: Could use self.fig now
+                self._colorbar = plt.colorbar(self._mesh, ax=self.ax)
+            else:
+                self._colorbar.update_normal(self._mesh)
 
         # Return the axes being drawn on
         return self.ax
@@ -243,11 +342,16 @@ class ClassificationReport(ClassificationScoreVisualizer):
         self.set_title("{} Classification Report".format(self.name))
 
         # Set the tick marks appropriately
-        self.ax.set_xticks(np.arange(len(self._displayed_scores)) + 0.5)
-        self.ax.set_yticks(np.arange(len(self.classes_)) + 0.5)
+        self.ax.set_xticks(_cell_centers(len(self._displayed_scores)))
+        self.ax.set_yticks(_cell_centers(len(self.classes_)))
 
         self.ax.set_xticklabels(self._displayed_scores, rotation=45)
-        self.ax.set_yticklabels(self.classes_)
+        # The class labels are converted to strings once per score; fall back to
+        # converting them here if the report is finalized before it is scored.
+        classes_str = getattr(self, "_classes_str", None)
+        if classes_str is None:
+            classes_str = tuple(map(str, self.classes_))
+        self.ax.set_yticklabels(classes_str)
 
         plt.tight_layout()  # TODO: Could use self.fig now
 
@@ -260,6 +364,10 @@ def classification_report(
     classes=None,
     random_state=None,
     is_fitted="auto",
+    test_size=0.2,
+    shuffle=True,
+    stratify=None,
+    colorbar=True,
     **kwargs
 ):
     """Quick method:
@@ -298,6 +406,22 @@ def classification_report(
         modified. If "auto" (default), a helper method will check if the estimator
         is fitted before fitting it again.
 
+    test_size : float or int, default=0.2
+        If float, the proportion of the dataset to reserve as test data. If int,
+        the absolute number of test samples.
+
+    shuffle : bool, default=True
+        Whether or not to shuffle the data before splitting. If the data is
+        already in random order, set to False to skip the permutation and split
+        the data into contiguous train and test blocks.
+
+    stratify : array-like or None, default=None
+        If not None, data is split in a stratified fashion using this as the
+        class labels. Requires shuffle to be True.
+
+    colorbar : bool, default: True
+        Specify if the colorbar should be drawn alongside the heatmap.
+
     kwargs: dict
         Keyword arguments passed to the super class.
 
@@ -305,15 +429,31 @@ def classification_report(
     -------
     ax : matplotlib axes
         Returns the axes that the classification report was drawn on.
+
+    Notes
+    -----
+    Data is split using ``sklearn.model_selection.train_test_split`` before
+    scoring the model, using the test_size, random_state, shuffle, and stratify
+    splitting options.
     """
     # Instantiate the visualizer
     visualizer = ClassificationReport(
-        model=model, ax=ax, classes=classes, is_fitted=is_fitted, **kwargs
+        model=model,
+        ax=ax,
+        classes=classes,
+        is_fitted=is_fitted,
+        colorbar=colorbar,
+        **kwargs
     )
 
     # Create the train and test splits
     X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=random_state
+        X,
+        y,
+        test_size=test_size,
+        random_state=random_state,
+        shuffle=shuffle,
+        stratify=stratify,
     )
 
     # Fit and transform the visualizer (calls draw)
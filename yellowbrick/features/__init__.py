@@ -17,15 +17,73 @@ Visualizers for feature analysis and diagnostics.
 ## Imports
 ##########################################################################
 
+import sys
+
+from importlib import import_module
+
 ## Hoist visualizers into the features namespace
-from .pcoords import ParallelCoordinates, parallel_coordinates
+# NOTE: the radviz and rfecv quick methods share their name with the module that
+# defines them, so they are imported eagerly to ensure the package attribute is
+# always the function rather than the submodule.
 from .radviz import RadialVisualizer, RadViz, radviz
-from .rankd import Rank1D, rank1d, Rank2D, rank2d
-from .jointplot import JointPlot, JointPlotVisualizer, joint_plot
-from .pca import PCA, PCADecomposition, pca_decomposition
-from .importances import FeatureImportances, feature_importances
 from .rfecv import RFECV, rfecv
-from .manifold import Manifold, manifold_embedding
 
 # Alias the TargetType defined in yellowbrick.utils.target
 from yellowbrick.utils.target import TargetType
+
+
+##########################################################################
+## Lazy Loading
+##########################################################################
+
+# The remaining visualizers are imported on first access (PEP 562) so that
+# importing a single visualizer does not load every scikit-learn dependency.
+_LAZY = {
+    "ParallelCoordinates": ".pcoords",
+    "parallel_coordinates": ".pcoords",
+    "Rank1D": ".rankd",
+    "rank1d": ".rankd",
+    "Rank2D": ".rankd",
+    "rank2d": ".rankd",
+    "JointPlot": ".jointplot",
+    "JointPlotVisualizer": ".jointplot",
+    "joint_plot": ".jointplot",
+    "PCA": ".pca",
+    "PCADecomposition": ".pca",
+    "pca_decomposition": ".pca",
+    "FeatureImportances": ".importances",
+    "feature_importances": ".importances",
+    "Manifold": ".manifold",
+    "manifold_embedding": ".manifold",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    "RadialVisualizer",
+    "RadViz",
+    "radviz",
+    "RFECV",
+    "rfecv",
+    "TargetType",
+] + list(_LAZY)
+
+
+# Module level __getattr__ requires Python 3.7, so import everything up front
+if sys.version_info < (3, 7):
+    for _name in _LAZY:
+        __getattr__(_name)
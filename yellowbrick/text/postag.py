@@ -19,7 +19,11 @@ small subset of documents.
 # Imports
 ##########################################################################
 
+import numbers
 import numpy as np
+import matplotlib as mpl
+
+from collections import Counter
 
 from yellowbrick.draw import bar_stack
 from yellowbrick.text.base import TextVisualizer
@@ -45,12 +49,81 @@ PENN_TAGS = [
     "interjection", "list", "symbol", "other"
 ]
 
+# Maps each Penn Treebank tag to its part-of-speech in PENN_TAGS
+_PENN_JUMP = {
+    # combine singular, plural and proper nouns
+    "NN": "noun", "NNS": "noun", "NNP": "noun", "NNPS": "noun",
+    "JJ": "adjective", "JJR": "adjective", "JJS": "adjective",
+    "VB": "verb", "VBD": "verb", "VBG": "verb", "VBN": "verb",
+    "VBP": "verb", "VBZ": "verb",
+    # include particles with adverbs
+    "RB": "adverb", "RBR": "adverb", "RBS": "adverb", "RP": "adverb",
+    "PRP": "pronoun", "PRP$": "pronoun",
+    "WDT": "wh- word", "WP": "wh- word", "WP$": "wh- word", "WRB": "wh- word",
+    "CC": "conjunction",
+    "CD": "digit",
+    # combine predeterminer and determiner
+    "DT": "determiner", "PDT": "determiner",
+    "EX": "existential",
+    "FW": "non-English",
+    "IN": "preposition",
+    "POS": "possessive",
+    "LS": "list",
+    "MD": "modal",
+    "TO": "infinitive",
+    "UH": "interjection",
+    "SYM": "symbol",
+}
+_PENN_JUMP.update((tag, "punctuation") for tag in PUNCT_TAGS)
+
+# Tags missing from the jump table are matched on their prefix, in order
+_PENN_PREFIXES = (
+    ("N", "noun"), ("J", "adjective"), ("V", "verb"),
+    ("RB", "adverb"), ("PR", "pronoun"), ("W", "wh- word"),
+)
+
 UNIVERSAL_TAGS = [
     "noun", "verb", "adjective", "adverb", "adposition", "determiner",
     "pronoun", "conjunction", "infinitive", "punctuation", "number", 
     "interjection", "symbol", "other"
 ]
 
+# Maps each Universal Dependencies tag to its part-of-speech in UNIVERSAL_TAGS
+_UNIVERSAL_JUMP = {
+    # combine proper and regular nouns
+    "NOUN": "noun", "PROPN": "noun",
+    "ADJ": "adjective",
+    "VERB": "verb",
+    # include particles with adverbs
+    "ADV": "adverb", "PART": "adverb",
+    "ADP": "adposition",
+    "PRON": "pronoun",
+    "CCONJ": "conjunction",
+    "PUNCT": "punctuation",
+    "DET": "determiner",
+    "NUM": "number",
+    "INTJ": "interjection",
+    "SYM": "symbol",
+}
+
+# Column index of each part-of-speech in the count arrays of each tagset
+_PENN_INDEX = {tag: idx for idx, tag in enumerate(PENN_TAGS)}
+_UNIVERSAL_INDEX = {tag: idx for idx, tag in enumerate(UNIVERSAL_TAGS)}
+
+
+def _penn_category(tag):
+    """
+    Returns the part-of-speech in PENN_TAGS for the specified Penn Treebank
+    tag, falling back to a prefix match for tags that are not in the table.
+    """
+    try:
+        return _PENN_JUMP[tag]
+    except KeyError:
+        for prefix, category in _PENN_PREFIXES:
+            if tag.startswith(prefix):
+                return category
+        return "other"
+
 
 ##########################################################################
 # PosTagVisualizer
@@ -99,6 +172,10 @@ class PosTagVisualizer(TextVisualizer):
         Plot the PosTag frequency chart as a per-class stacked bar chart. 
         Note that fit() requires y for this visualization.
 
+    top_k : int, default: None
+        If set, only the top_k most frequent part-of-speech tags are plotted,
+        sorted by frequency if frequency=True, otherwise in tagset order.
+
     kwargs : dict
         Pass any additional keyword arguments to the PosTagVisualizer.
     
@@ -114,6 +191,12 @@ class PosTagVisualizer(TextVisualizer):
     >>> viz.poof()
     """
 
+    # The names of the tag map and handler methods of each tagset
+    _TAGSET_HANDLERS = {
+        "penn_treebank": ("_penn_tag_map", "_handle_treebank"),
+        "universal": ("_uni_tag_map", "_handle_universal"),
+    }
+
     def __init__(
         self,
         ax=None,
@@ -122,28 +205,24 @@ class PosTagVisualizer(TextVisualizer):
         colors=None,
         frequency=False,
         stack=False,
+        top_k=None,
         **kwargs
     ):
         super(PosTagVisualizer, self).__init__(ax=ax, **kwargs)
 
         self.tagset_names = TAGSET_NAMES
+        self._check_tagset(tagset)
+        self.tagset = tagset
 
-        if tagset not in self.tagset_names:
-            raise YellowbrickValueError((
-                "'{}' is an invalid tagset. Please choose one of {}."
-            ).format(
-                tagset, ", ".join(self.tagset_names.keys())
-            ))
-        else:
-            self.tagset = tagset
+        self._check_top_k(top_k)
 
-        self.punct_tags = frozenset(PUNCT_TAGS)
         self.frequency = frequency
         self.colormap = colormap
         self.colors = colors
         self.stack = stack
+        self.top_k = top_k
 
-    def fit(self, X, y=None, **kwargs):
+    def fit(self, X, y=None, tags_are_flat=False, **kwargs):
         """
         Fits the corpus to the appropriate tag map.
         Text documents must be tokenized & tagged before passing to fit.
@@ -153,11 +232,20 @@ class PosTagVisualizer(TextVisualizer):
         X : list or generator
             Should be provided as a list of documents or a generator
             that yields a list of documents that contain a list of
-            sentences that contain (token, tag) tuples.
+            sentences that contain (token, tag) tuples. If tags_are_flat
+            is True, X should instead be a 1D array or Series that contains
+            the tag of every token in the corpus.
 
         y : ndarray or Series of length n
             An optional array of target values that are ignored by the
-            visualizer.
+            visualizer unless stack=True. If tags_are_flat is True, y must
+            contain the target value of every token rather than every
+            document.
+
+        tags_are_flat : bool, default: False
+            Specify that X is a flat array of tags, e.g. a column of a
+            DataFrame of tagged tokens, which is counted without iterating
+            over the tags in Python.
 
         kwargs : dict
             Pass generic arguments to the drawing method
@@ -172,47 +260,96 @@ class PosTagVisualizer(TextVisualizer):
             if y is None:
                 raise YellowbrickValueError("Specify y for stack=True")
             self.labels_ = np.unique(y)
+        self._label_index = {
+            label: idx for idx, label in enumerate(self.labels_)
+        }
 
-        if self.tagset == "penn_treebank":
-            self.pos_tag_counts_ = self._penn_tag_map()
-            self._handle_treebank(X, y)
-
-        elif self.tagset == "universal":
-            self.pos_tag_counts_ = self._uni_tag_map()
-            self._handle_universal(X, y)
+        # the tagset may have been changed with set_params since init
+        self._check_tagset(self.tagset)
+        tag_map, handle = (
+            getattr(self, name) for name in self._TAGSET_HANDLERS[self.tagset]
+        )
+        self._pos_tag_counts = tag_map()
+        self._pos_tag_counts_map = None
+        handle(X, y, tags_are_flat)
 
         self.draw()
 
         return self
 
+    def _check_tagset(self, tagset):
+        """
+        Raises an exception if the specified tagset is unknown.
+        """
+        if tagset not in self.tagset_names:
+            raise YellowbrickValueError((
+                "'{}' is an invalid tagset. Please choose one of {}."
+            ).format(
+                tagset, ", ".join(self.tagset_names.keys())
+            ))
+
+    def _check_top_k(self, top_k):
+        """
+        Raises an exception if top_k is specified but is not a positive integer.
+        """
+        if top_k is None:
+            return
+
+        if (
+            isinstance(top_k, bool) or not isinstance(top_k, numbers.Integral)
+            or top_k < 1
+        ):
+            raise YellowbrickValueError(
+                "top_k must be a positive integer, not {!r}".format(top_k)
+            )
+
+    @property
+    def pos_tag_counts_(self):
+        """
+        Mapping of labels to a mapping of part-of-speech tags to counts, built
+        from the (n_labels, n_tags) array of counts computed during fit. The
+        mapping is built on first access and reused until the next fit.
+        """
+        if not hasattr(self, "_pos_tag_counts"):
+            raise AttributeError(
+                "'{}' object has no attribute 'pos_tag_counts_'".format(
+                    self.__class__.__name__
+                )
+            )
+
+        if self._pos_tag_counts_map is None:
+            self._pos_tag_counts_map = {
+                label: dict(zip(self._tag_index, row))
+                for label, row in zip(
+                    self.labels_, self._pos_tag_counts.tolist()
+                )
+            }
+        return self._pos_tag_counts_map
+
     def _penn_tag_map(self):
         """
-        Returns a Penn Treebank part-of-speech tag map.
+        Returns a Penn Treebank part-of-speech tag count array.
         """
         self._pos_tags = PENN_TAGS
+        self._tag_index = _PENN_INDEX
         return self._make_tag_map(PENN_TAGS)
 
     def _uni_tag_map(self):
         """
-        Returns a Universal Dependencies part-of-speech tag map.
+        Returns a Universal Dependencies part-of-speech tag count array.
         """
         self._pos_tags = UNIVERSAL_TAGS
+        self._tag_index = _UNIVERSAL_INDEX
         return self._make_tag_map(UNIVERSAL_TAGS)
 
     def _make_tag_map(self, tagset):
         """
-        Returns a map of the tagset to a counter unless stack=True then returns
-        a map of labels to a map of tagset to counters. 
+        Returns a zeroed array of counts with a row per label (a single row
+        unless stack=True) and a column per tag in the tagset.
         """
-        # ensures the dict contains a zero counter per tag
-        zeros = [0] * len(tagset)
-        return {
-            label: dict(zip(tagset, zeros))
-            for label in self.labels_
-        }
-        return dict(zip(tagset, zeros))
+        return np.zeros((len(self.labels_), len(tagset)), dtype=np.int64)
 
-    def _handle_universal(self, X, y=None):
+    def _handle_universal(self, X, y=None, tags_are_flat=False):
         """
         Scan through the corpus to compute counts of each Universal
         Dependencies part-of-speech.
@@ -223,37 +360,20 @@ class PosTagVisualizer(TextVisualizer):
             Should be provided as a list of documents or a generator
             that yields a list of documents that contain a list of
             sentences that contain (token, tag) tuples.
-        """
-        jump = {
-            # combine proper and regular nouns
-            "NOUN": "noun", "PROPN": "noun",
-            "ADJ": "adjective",
-            "VERB": "verb",
-            # include particles with adverbs
-            "ADV": "adverb", "PART": "adverb",
-            "ADP": "adposition",
-            "PRON": "pronoun",
-            "CCONJ": "conjunction",
-            "PUNCT": "punctuation",
-            "DET": "determiner",
-            "NUM": "number",
-            "INTJ": "interjection",
-            "SYM": "symbol",
-        }
 
-        for idx, tagged_doc in enumerate(X):
-            for tagged_sent in tagged_doc:
-                for _, tag in tagged_sent:
-                    if tag == "SPACE":
-                        continue
-                    if self.stack:
-                        counter = self.pos_tag_counts_[y[idx]] 
-                    else:
-                        counter = self.pos_tag_counts_['documents']
-
-                    counter[jump.get(tag, "other")] += 1
-
-    def _handle_treebank(self, X, y=None):
+        tags_are_flat : bool, default: False
+            Specify that X is a flat array of the tag of every token.
+        """
+        label_index, tag_index = self._label_index, self._tag_index
+        raw_tag_counts = self._count_raw_tags(X, y, tags_are_flat)
+        for label, raw_counts in raw_tag_counts.items():
+            counts = self._pos_tag_counts[label_index[label]]
+            for tag, count in raw_counts.items():
+                if tag == "SPACE":
+                    continue
+                counts[tag_index[_UNIVERSAL_JUMP.get(tag, "other")]] += count
+
+    def _handle_treebank(self, X, y=None, tags_are_flat=False):
         """
         Create a part-of-speech tag mapping using the Penn Treebank tags
 
@@ -263,57 +383,102 @@ class PosTagVisualizer(TextVisualizer):
             Should be provided as a list of documents or a generator
             that yields a list of documents that contain a list of
             sentences that contain (token, tag) tuples.
+
+        tags_are_flat : bool, default: False
+            Specify that X is a flat array of the tag of every token.
+        """
+        label_index, tag_index = self._label_index, self._tag_index
+        raw_tag_counts = self._count_raw_tags(X, y, tags_are_flat)
+        for label, raw_counts in raw_tag_counts.items():
+            counts = self._pos_tag_counts[label_index[label]]
+            for tag, count in raw_counts.items():
+                counts[tag_index[_penn_category(tag)]] += count
+
+    def _count_raw_tags(self, X, y=None, tags_are_flat=False):
         """
+        Scan through the corpus once to count the occurrences of each raw tag
+        per label, so that tags are mapped to parts-of-speech once per unique
+        tag rather than once per token.
+
+        Parameters
+        ----------
+        X : list or generator
+            Should be provided as a list of documents or a generator
+            that yields a list of documents that contain a list of
+            sentences that contain (token, tag) tuples.
+
+        tags_are_flat : bool, default: False
+            Specify that X is a flat array of the tag of every token, which
+            is counted with np.unique rather than a Counter.
+
+        Returns
+        -------
+        raw_counts : dict
+            Mapping of labels to the counts of the raw tags in their documents.
+        """
+        if tags_are_flat:
+            return self._count_flat_tags(X, y)
+
+        if not self.stack:
+            # count the whole corpus with a single update rather than one
+            # (Python-level) Counter.update call per document
+            return {'documents': Counter(
+                tag for tagged_doc in X
+                for tagged_sent in tagged_doc for _, tag in tagged_sent
+            )}
+
+        raw_counts = {label: Counter() for label in self._label_index}
         for idx, tagged_doc in enumerate(X):
-            for tagged_sent in tagged_doc:
-                for _, tag in tagged_sent:
-                    if self.stack:
-                        counter = self.pos_tag_counts_[y[idx]] 
-                    else:
-                        counter = self.pos_tag_counts_['documents']
-
-                    if tag.startswith("N"):
-                        counter["noun"] += 1
-                    elif tag.startswith("J"):
-                        counter["adjective"] += 1
-                    elif tag.startswith("V"):
-                        counter["verb"] += 1
-                    # include particles with adverbs
-                    elif tag.startswith("RB") or tag == "RP":
-                        counter["adverb"] += 1
-                    elif tag.startswith("PR"):
-                        counter["pronoun"] += 1
-                    elif tag.startswith("W"):
-                        counter["wh- word"] += 1
-                    elif tag == "CC":
-                        counter["conjunction"] += 1
-                    elif tag == "CD":
-                        counter["digit"] += 1
-                    # combine predeterminer and determiner
-                    elif tag in ["DT" or "PDT"]:
-                        counter["determiner"] += 1
-                    elif tag == "EX":
-                        counter["existential"] += 1
-                    elif tag == "FW":
-                        counter["non-English"] += 1
-                    elif tag == "IN":
-                        counter["preposition"] += 1
-                    elif tag == "POS":
-                        counter["possessive"] += 1
-                    elif tag == "LS":
-                        counter["list"] += 1
-                    elif tag == "MD":
-                        counter["modal"] += 1
-                    elif tag in self.punct_tags:
-                        counter["punctuation"] += 1
-                    elif tag == "TO":
-                        counter["infinitive"] += 1
-                    elif tag == "UH":
-                        counter["interjection"] += 1
-                    elif tag == "SYM":
-                        counter["symbol"] += 1
-                    else:
-                        counter["other"] += 1
+            raw_counts[y[idx]].update(
+                tag for tagged_sent in tagged_doc for _, tag in tagged_sent
+            )
+        return raw_counts
+
+    def _count_flat_tags(self, X, y=None):
+        """
+        Counts the occurrences of each raw tag per label in a flat array of
+        the tag of every token, with per-token labels in y if stack=True.
+        """
+        tags = np.asarray(X)
+        if tags.ndim != 1:
+            raise YellowbrickValueError(
+                "X must be a 1D array of tags when tags_are_flat=True"
+            )
+
+        # missing tags (e.g. None or NaN in a pandas Series) cannot be sorted
+        # by np.unique and do not belong to any part-of-speech
+        if tags.dtype.kind == "O":
+            has_nulls = any(tag is None or tag != tag for tag in tags)
+        else:
+            has_nulls = tags.dtype.kind == "f" and np.isnan(tags).any()
+        if has_nulls:
+            raise YellowbrickValueError(
+                "X must not contain missing tags when tags_are_flat=True"
+            )
+
+        if not self.stack:
+            uniques, counts = np.unique(tags, return_counts=True)
+            return {'documents': dict(zip(uniques, counts))}
+
+        y = np.asarray(y)
+        if y.shape != tags.shape:
+            raise YellowbrickValueError(
+                "y must contain a label for every tag when tags_are_flat=True"
+            )
+
+        # Histogram every (label, tag) pair in a single pass; the inverse of
+        # the unique labels indexes self.labels_ since both are np.unique(y).
+        uniques, tag_codes = np.unique(tags, return_inverse=True)
+        _, label_codes = np.unique(y, return_inverse=True)
+        counts = np.bincount(
+            label_codes * len(uniques) + tag_codes,
+            minlength=len(self.labels_) * len(uniques),
+        ).reshape(len(self.labels_), len(uniques))
+
+        return {
+            label: dict(zip(uniques, row))
+            for label, row in zip(self.labels_, counts)
+        }
 
     def draw(self, **kwargs):
         """
@@ -330,18 +495,34 @@ class PosTagVisualizer(TextVisualizer):
         ax : matplotlib axes
             Axes on which the PosTagVisualizer was drawn.
         """
-        # Converts nested dict to nested list
-        pos_tag_counts = np.array([
-            list(i.values()) for i in self.pos_tag_counts_.values()
-        ])
-        # stores sum of nested list column wise
+        # counts array with a row per label and a column per tag
+        pos_tag_counts = self._pos_tag_counts
+        # stores sum of the counts column wise
         pos_tag_sum = np.sum(pos_tag_counts, axis=0)
 
-        if self.frequency:
+        # top_k may have been changed with set_params since init
+        self._check_top_k(self.top_k)
+
+        idx = None
+        if self.top_k is not None:
+            # selects the k most frequent tags without sorting all of them
+            k = min(self.top_k, len(pos_tag_sum))
+            # argpartition returns the selection in arbitrary order, so sort it
+            # into tagset order first to ensure ties are ordered by the tagset
+            idx = np.sort(np.argpartition(-pos_tag_sum, k - 1)[:k])
+            if self.frequency:
+                idx = idx[np.argsort(-pos_tag_sum[idx], kind="stable")]
+
+        elif self.frequency:
             # sorts the count and tags by sum for frequency true
             idx = (pos_tag_sum).argsort()[::-1]
-            self._pos_tags = np.array(self._pos_tags)[idx] 
-            pos_tag_counts = pos_tag_counts[:,idx]
+
+        # always start from the tagset order so that repeated draws (e.g. after
+        # frequency or top_k are changed with set_params) label the bars correctly
+        self._pos_tags = list(self._tag_index)
+        if idx is not None:
+            self._pos_tags = np.take(self._pos_tags, idx)
+            pos_tag_counts = np.take(pos_tag_counts, idx, axis=1)
 
         if self.stack:
             bar_stack(
@@ -350,16 +531,31 @@ class PosTagVisualizer(TextVisualizer):
             )
         else:
             xidx = np.arange(len(self._pos_tags))
-            colors = resolve_colors(
-                n_colors=len(self._pos_tags), colormap=self.colormap,
-                colors=self.colors
-            )
+            colors = self._resolve_colors(len(self._pos_tags))
             self.ax.bar(
                 xidx, pos_tag_counts[0], color=colors
             )
 
         return self.ax
 
+    def _resolve_colors(self, n_colors):
+        """
+        Resolves the bar colors, reusing the colors of the previous draw if
+        the number of colors, the color arguments, and the color cycle they
+        default to have not changed since.
+        """
+        key = (
+            n_colors, self.colormap,
+            None if self.colors is None else tuple(self.colors),
+            mpl.rcParams["axes.prop_cycle"],
+        )
+        if getattr(self, "_colors_key", None) != key:
+            self._colors_cache = resolve_colors(
+                n_colors=n_colors, colormap=self.colormap, colors=self.colors
+            )
+            self._colors_key = key
+        return self._colors_cache
+
     def finalize(self, **kwargs):
         """
         Finalize the plot with ticks, labels, and title
@@ -389,7 +585,7 @@ class PosTagVisualizer(TextVisualizer):
 
         self.set_title(
             "PosTag plot for {}-token corpus".format(
-                (sum([sum(i.values()) for i in self.pos_tag_counts_.values()]))
+                int(self._pos_tag_counts.sum())
             )
         )
 
@@ -412,6 +608,7 @@ def postag(
     colors=None,
     frequency=False,
     stack=False,
+    top_k=None,
     **kwargs
 ):
 
@@ -446,6 +643,9 @@ def postag(
         If set to True, part-of-speech tags will be plotted according to frequency,
         from most to least frequent.
 
+    top_k : int, default: None
+        If set, only the top_k most frequent part-of-speech tags are plotted.
+
     kwargs : dict
         Pass any additional keyword arguments to the PosTagVisualizer.
 
@@ -457,7 +657,7 @@ def postag(
     # Instantiate the visualizer
     visualizer = PosTagVisualizer(
         ax=ax, tagset=tagset, colors=colors, colormap=colormap,
-        frequency=frequency, stack=stack, **kwargs
+        frequency=frequency, stack=stack, top_k=top_k, **kwargs
     )
 
     # Fit and transform the visualizer (calls draw)